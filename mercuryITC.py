@@ -11,19 +11,75 @@
 
 import serial
 import numpy as np
+import re
+import contextlib
+import functools
+import selectors
 import time
 import socket
-import sys
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+SI_PREFIXES = {"M": 1e6, "k" : 1e3, "m" : 1e-3, "\xb5" : 1e-6, "\u03bc" : 1e-6, "u" : 1e-6, "n" : 1e-9, "p" : 1e-12}
+
+#value, optional SI prefix and unit of a signal, e.g. 293.1500K or 7.0000mV.
+#Anything else, e.g. an unknown prefix, does not match.
+SIGNAL_PATTERN = re.compile(r"([-+]?[0-9.]+(?:[eE][-+]?[0-9]+)?)([Mkm\xb5\u03bcunp]?)(K|V|A|Ohm|W)")
+
+def decodeReply(reply):
+    """Decode a reply of the device. Non-ASCII characters (the micro sign) are
+    accepted both UTF-8 and Latin-1 encoded."""
+    try:
+        return reply.decode("utf-8")
+    except UnicodeDecodeError:
+        return reply.decode("latin-1")
+
+#a steady device repeats the same replies, so recent results are cached
+@functools.lru_cache(maxsize = 4096)
+def parseSignal(reply, path):
+    """Convert a signal reply, e.g. STAT:DEV:DB7.T1:TEMP:SIG:TEMP:293.1500K, to a float.
+    unitPrefixes are taken into account.
+
+    - reply: reply of the device
+    - path: signal that was requested, e.g. DEV:DB7.T1:TEMP:SIG:TEMP. A ValueError is
+      raised if the reply does not answer it.
+    """
+    head, _, ans = reply.rpartition(":")
+    if head != "STAT:" + path:
+        raise ValueError("Reply {!r} does not answer READ:{}".format(reply, path))
+    match = SIGNAL_PATTERN.fullmatch(ans)
+    if match is None:
+        raise ValueError("Unparseable signal reply: {!r}".format(reply))
+    return float(match.group(1))*SI_PREFIXES.get(match.group(2), 1.0)
 
 class temperatureController(object):
+    #format of a row of the calibration log, see calibrate
+    calibrationRowFormat = "%.6e " * 9 + "%.6e\n"
+
     def __init__(self, port, baudrate = 115200):
-        self.ser = serial.Serial(port, baudrate=baudrate, stopbits = serial.STOPBITS_ONE, timeout = 1)
+        self.ser = serial.Serial(port, baudrate=baudrate, stopbits = serial.STOPBITS_ONE, timeout = 0.05)
+        #the serial line carries one transaction at a time
+        self.serLock = threading.RLock()
+        self.pool = None
         time.sleep(2)
         self.defineDevices()
 
     def defineDevices(self):
         #store the device addresses in a dictionary
         self.devices = {"db7" : "DEV:DB7.T1:TEMP", "db6" : "DEV:DB6.T1:TEMP", "mb1" : "DEV:MB1.T1:TEMP"}
+        #queries for the signals that are read in the polling loops
+        self.signalQueries = {(device, signal) : self.signalQuery((address + ":SIG:" + signal,))
+                              for device, address in self.devices.items()
+                              for signal in ("VOLT", "CURR", "RES", "TEMP")}
+        #compound queries for getSensorInformation, keyed by device and includeTemperature
+        self.sensorQueries = {(device, includeTemperature) : self.signalQuery(
+                                  tuple(address + ":SIG:" + signal
+                                        for signal in self.sensorSignals(includeTemperature)))
+                              for device, address in self.devices.items()
+                              for includeTemperature in (False, True)}
+        #cleared if the firmware does not answer compound queries
+        self.compoundQueries = True
         
     def getVersion(self):
         string = self.readValue("*IDN?", readPrefix = "")
@@ -31,23 +87,75 @@ class temperatureController(object):
 
     def getDevices(self):
         devices = self.readValue("SYS:CAT")
-        print devices
+        print(devices)
+
+    def encodeCommand(self, value):
+        """Terminate a command and encode it for sending to the device."""
+        return (value + "\r\n").encode("ascii")
 
     def writeValue(self, value):
-        self.ser.write(value + "\n\r")
-        time.sleep(3)
+        with self.serLock:
+            self.ser.write(self.encodeCommand(value))
+
+    def readReply(self, timeout = 0.5):
+        """Read a newline terminated reply from the device.
+
+        Returns as soon as the reply is complete, raises an IOError if it
+        has not arrived within timeout seconds. Signal replies are additionally
+        checked against the query in parseSignals."""
+        deadline = time.monotonic() + timeout
+        reply = self.ser.read_until()
+        while not reply.endswith(b"\n"):
+            if time.monotonic() > deadline:
+                #discard the partial reply and anything still arriving,
+                #it must not be read as the next answer
+                self.discardInput()
+                raise IOError("No reply from device within {:.2f} s".format(timeout))
+            reply += self.ser.read_until()
+        return decodeReply(reply.rstrip())
+
+    def query(self, command):
+        """Send an encoded command to the device and return the reply."""
+        with self.serLock:
+            self.ser.write(command)
+            return self.readReply()
+
+    def transaction(self):
+        """Context manager that keeps other threads off the line while a query,
+        the check of its reply and the discarding of pending input are done."""
+        return self.serLock
+
+    def discardInput(self):
+        """Discard everything the device sends until the line has been quiet for one read timeout."""
+        with self.serLock:
+            while self.ser.read(max(1, self.ser.in_waiting)):
+                pass
 
     def readValue(self, value, readPrefix = "READ:"):
-        self.writeValue(readPrefix + value)
-        string = self.ser.readline().rstrip()
-        self.ser.flush()
-        return string
+        return self.query(self.encodeCommand(readPrefix + value))
 
     def setValue(self, value):
-        self.writeValue("SET:" + value)
-        string = self.ser.readline().rstrip()
+        #the device acknowledges every SET command, the reply has to be read
+        #so that it is not mistaken for the answer to the next query
+        return self.readValue(value, readPrefix = "SET:")
+
+    def getPool(self):
+        """Return the thread pool that queries the devices concurrently.
+
+        The pool lives as long as the controller, so that its threads, and with the
+        Ethernet interface their connections, are reused by later calls."""
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers = 3)
+        return self.pool
+
+    def closePool(self):
+        """Shut down the thread pool, waiting for running queries to finish."""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
 
     def close(self):
+        self.closePool()
         self.ser.close()
 
 
@@ -58,33 +166,57 @@ class temperatureController(object):
         - device: device key for the devices dictionary
         - signal: string corresponding to a valid signal, i.e. TEMP, VOLT, CURR, RES, etc.
         """
-        ans = self.readValue(self.devices[device] + ":SIG:" + signal).split(":")[-1]
-
-        siPrefixes = {"M": 1e6, "k" : 1e3, "m" : 1e-3, "\xb5" : 1e-6, "n" : 1e-9, "p" : 1e-12}
-        
-        if ans[-2].isdigit():
-            return float(ans[:-2])
+        signalQuery = self.signalQueries.get((device, signal))
+        if signalQuery is None:
+            signalQuery = self.signalQuery((self.devices[device] + ":SIG:" + signal,))
+        paths, command = signalQuery
+        with self.transaction():
+            return self.parseSignals(self.query(command), paths)[0]
+
+    def signalQuery(self, paths):
+        """Return the signal paths and the encoded, semicolon separated query for them."""
+        return paths, self.encodeCommand(";".join("READ:" + path for path in paths))
+
+    def parseSignals(self, reply, paths):
+        """Parse the reply to a signal query into one float per signal path.
+
+        If the reply does not answer the query, the pending input is discarded, so that
+        it is not read as the answer to the next query, and a ValueError is raised."""
+        fields = reply.split(";")
+        try:
+            if len(fields) != len(paths):
+                raise ValueError("Reply {!r} does not answer {}".format(reply, ";".join(paths)))
+            return tuple(parseSignal(field, path) for field, path in zip(fields, paths))
+        except ValueError:
+            self.discardInput()
+            raise
+
+    def sensorSignals(self, includeTemperature = False):
+        """Signals returned by getSensorInformation"""
+        if includeTemperature:
+            return ("VOLT", "CURR", "RES", "TEMP")
         else:
-            try:
-                return float(ans[:-2])*siPrefixes[ans[-2]]
-            except:
-                print "Ans: ", ans
-                raise ValueError 
+            return ("VOLT", "CURR", "RES")
 
     def getSensorInformation(self, device, includeTemperature = False):
-        """Get Voltage, Current, Resistance and optionally Temperature of a device"""
-
-        v = self.getSignal(device, "VOLT")
-        c = self.getSignal(device, "CURR")
-        r = self.getSignal(device, "RES")
-
-        if includeTemperature:
-            t = self.getSignal(device, "TEMP")
-            return v,c,r,t
-        else:
-            return v,c,r
+        """Get Voltage, Current, Resistance and optionally Temperature of a device
+
+        All signals are requested in a single semicolon separated query. If the firmware
+        does not answer such compound queries, the signals are requested one by one."""
+        if self.compoundQueries:
+            paths, command = self.sensorQueries[(device, includeTemperature)]
+            with self.transaction():
+                reply = self.query(command)
+                if reply.count(";") == len(paths) - 1:
+                    return self.parseSignals(reply, paths)
+                #the firmware does not answer compound queries, or answers every part on a line
+                #of its own. The remaining lines must not be read as the answers to later queries.
+                self.discardInput()
+                self.compoundQueries = False
+
+        return tuple(self.getSignal(device, signal) for signal in self.sensorSignals(includeTemperature))
     
-    def calibrate(self, sensorNameDB6, sensorNameMB):
+    def calibrate(self, sensorNameDB6, sensorNameMB, interval = 1.0):
         """Calibration Routine. Calibrated sensor connected to port DB7
         Two sensors to be calibrated connected to ports DB6 and MB
         
@@ -93,6 +225,8 @@ class temperatureController(object):
         Make sure that all boards are configured correctly, i.e. for NTC sensors in constant voltage mode, with voltage set to 7 mV. Configuration has to be done using the devices Touchscreen UI.
 
         Note that this routine only records the three sensor values. In our setup the temperature sweep is achieved using a second temperature controller.
+
+        A new acquisition is started every interval seconds, or as soon as the previous one has finished if it takes longer.
         """
 
         #in the command below, the unit of magnitude is mV and should not be supplied.
@@ -100,26 +234,7 @@ class temperatureController(object):
         #This currently has to be set via the Touchscreen Interface of the device.
         #self.setValue(self.devices["db7"] + ":TYPE:NTC:EXCT:TYPE:UNIP:MAG:7:CALB:X96620.dat")
 
-        calList = []
-        sensor_db6List = []
-        sensor_mb1List = []
-        
-        while True:
-            try:
-                cal = self.getSensorInformation("db7", includeTemperature = True)
-                sensor_db6 = self.getSensorInformation("db6")
-                sensor_mb1 = self.getSensorInformation("mb1")
-
-                calList.append(cal)
-                sensor_db6List.append(sensor_db6)
-                sensor_mb1List.append(sensor_mb1)
-
-                exportArray = np.hstack((np.array(calList), np.array(sensor_db6List), np.array(sensor_mb1List)))
-
-                print "Export Array, ", exportArray
-                print "Rc: ", cal[2], "T: ", cal[3], "R1: ", sensor_db6[2], "R2: ", sensor_mb1[2]
-                
-                headerString = """######################################
+        headerString = """######################################
 
   Calibration Log
 
@@ -133,47 +248,149 @@ class temperatureController(object):
   (Columns 8 to 10: Voltage, Current, Resistance)
 
 ######################################"""
-                
-                np.savetxt("calibration.txt", exportArray, fmt="%.6e", header = headerString, comments = "#")
+        sensorHeader = "Temperature (K)\t Resistance (Ohm)\nExcitation: Constant Voltage, 7mV"
+
+        #the log file is opened once and one row is appended per acquisition,
+        #the header lines are written in the same format as np.savetxt does.
+        #The sensor files are written in one go when the calibration ends.
+        calFile = open("calibration.txt", "w", buffering = 1 << 16)
+        calFile.write("#" + headerString.replace("\n", "\n#") + "\n")
+
+        #the rows are written by a separate thread, so that the next acquisition
+        #does not have to wait for the file. An error of the writer is stored in writerErrors.
+        rowQueue = queue.Queue(maxsize = 1024)
+        writerErrors = []
+        writer = threading.Thread(target = self.writeCalibrationRows, args = (rowQueue, calFile, writerErrors))
+        writer.daemon = True
+        writer.start()
+
+        #preallocated buffer, doubled whenever it is full
+        exportArray = np.empty((1024, 10))
+        n = 0
+
+        #the three devices are queried concurrently. The boards measure continuously and
+        #a READ returns the latest value, so no conversion has to be triggered first.
+        pool = self.getPool()
+        nextAcquisition = time.monotonic()
 
-                np.savetxt(sensorNameDB6 + ".dat", exportArray[:,[3,6]], fmt="%.6e", header = "Temperature (K)\t Resistance (Ohm)\nExcitation: Constant Voltage, 7mV", comments = "#")
-                np.savetxt(sensorNameMB + ".dat", exportArray[:,[3,9]], fmt="%.6e", header = "Temperature (K)\t Resistance (Ohm)\nExcitation: Constant Voltage, 7mV", comments = "#")
-                time.sleep(1)        
-                                
-            except KeyboardInterrupt:
-                print "Keyboard Interrupt caught. Finishing Calibration."
-                print "Minimum Temperature achieved: ", np.min(exportArray[:,3])
-                print "Maximum Temperature achieved: ", np.max(exportArray[:,3])
-                break
+        try:
+            while not writerErrors:
+                calFuture = pool.submit(self.getSensorInformation, "db7", includeTemperature = True)
+                db6Future = pool.submit(self.getSensorInformation, "db6")
+                mb1Future = pool.submit(self.getSensorInformation, "mb1")
+                cal = calFuture.result()
+                sensor_db6 = db6Future.result()
+                sensor_mb1 = mb1Future.result()
+
+                if n == len(exportArray):
+                    exportArray = np.resize(exportArray, (2*len(exportArray), 10))
+                exportArray[n, 0:4] = cal
+                exportArray[n, 4:7] = sensor_db6
+                exportArray[n, 7:10] = sensor_mb1
+                n += 1
+
+                print("Export Array, ", exportArray[:n])
+                print("Rc: ", cal[2], "T: ", cal[3], "R1: ", sensor_db6[2], "R2: ", sensor_mb1[2])
+
+                rowQueue.put((cal, sensor_db6, sensor_mb1))
+                nextAcquisition = self.waitUntil(nextAcquisition + interval)
+
+        except KeyboardInterrupt:
+            print("Keyboard Interrupt caught. Finishing Calibration.")
+            if n > 0:
+                print("Minimum Temperature achieved: ", np.min(exportArray[:n,3]))
+                print("Maximum Temperature achieved: ", np.max(exportArray[:n,3]))
+
+        finally:
+            #on every exit, also on a device error, the logged rows are written out
+            rowQueue.put(None)
+            writer.join()
+
+            #temperature of the calibrated sensor and resistance of the sensor
+            sensorFormat = "%.6e %.6e\n".__mod__
+            temperatures = exportArray[:n, 3].tolist()
+            for sensorName, column in ((sensorNameDB6, 6), (sensorNameMB, 9)):
+                rows = map(sensorFormat, zip(temperatures, exportArray[:n, column].tolist()))
+                with open(sensorName + ".dat", "w") as f:
+                    f.write("#" + sensorHeader.replace("\n", "\n#") + "\n")
+                    f.write("".join(rows))
+
+            if writerErrors:
+                raise writerErrors[0]
+
+    def waitUntil(self, deadline):
+        """Sleep until deadline and return it. If the deadline has already passed,
+        return the current time instead, so that missed intervals are not caught up in a burst."""
+        slack = deadline - time.monotonic()
+        if slack > 0:
+            time.sleep(slack)
+            return deadline
+        return time.monotonic()
+
+    def writeCalibrationRows(self, rowQueue, calFile, errors):
+        """Write the rows put on rowQueue by calibrate to calFile until None is received,
+        then close the file.
+
+        If writing fails, the error is appended to errors and the remaining rows are
+        taken from the queue without writing them, so that calibrate never blocks on it."""
+        try:
+            while True:
+                row = rowQueue.get()
+                if row is None:
+                    break
+                if errors:
+                    continue
+                cal, sensor_db6, sensor_mb1 = row
+                try:
+                    calFile.write(self.calibrationRowFormat % (cal[0], cal[1], cal[2], cal[3],
+                                                               sensor_db6[0], sensor_db6[1], sensor_db6[2],
+                                                               sensor_mb1[0], sensor_mb1[1], sensor_mb1[2]))
+                except Exception as e:
+                    errors.append(e)
+        finally:
+            try:
+                calFile.close()
+            except Exception as e:
+                errors.append(e)
+
+    def autoPollTemperatures(self, interval = 1.0):
+        """Poll the temperatures of MB1, DB6 and DB7 every interval seconds until interrupted.
 
-    def autoPollTemperatures(self):
-        timeList = []
-        t1List = []
-        t2List = []
-        t3List = []
+        The readings are logged to tempLog_<starttime>.bin as rows of four float64 values
+        (Time, T1, T2, T3). Use exportTempLog to convert the log to a text file.
 
+        Returns the readings as an array with the same four columns."""
         startTime = time.time()
-        while True:
-            try:
-                timeNow = time.time() - startTime
-                t1 = self.getSignal("mb1", "TEMP")
-                t2 = self.getSignal("db6", "TEMP")
-                t3 = self.getSignal("db7", "TEMP")
 
-                print "MB1 {:.3f} K    DB6 {:.3f} K       DB7 {:.3f} K".format(t1, t2, t3)
+        #preallocated buffer, doubled whenever it is full
+        tempLog = np.empty((1024, 4))
+        n = 0
+
+        #see calibrate
+        pool = self.getPool()
+        nextAcquisition = time.monotonic()
 
-                timeList.append(timeNow)
-                t1List.append(t1)
-                t2List.append(t2)
-                t3List.append(t3)
+        #the log file is opened once and one row is appended per reading
+        with open("tempLog_" + str(startTime) + ".bin", "wb", buffering = 1 << 16) as logFile:
+            try:
+                while True:
+                    timeNow = time.time() - startTime
+                    futures = [pool.submit(self.getSignal, device, "TEMP") for device in ("mb1", "db6", "db7")]
+                    t1, t2, t3 = [f.result() for f in futures]
 
-                #np.savetxt("tempLog_" + str(startTime) + ".txt", np.transpose(np.vstack((np.array(timeList), np.array(t1List), np.array(t2List), np.array(t3List)))), header = "Time\tT1\tT2\tT3", comments="#", fmt="%.6e")
+                    print("MB1 {:.3f} K    DB6 {:.3f} K       DB7 {:.3f} K".format(t1, t2, t3))
 
-                np.savetxt("tempLog_" + str(startTime) + ".txt", np.vstack((np.array(timeList), np.array(t1List), np.array(t2List), np.array(t3List))).T, header = "Time\tT1\tT2\tT3", comments="#", fmt="%.6e")
+                    if n == len(tempLog):
+                        tempLog = np.resize(tempLog, (2*len(tempLog), 4))
+                    tempLog[n] = (timeNow, t1, t2, t3)
+                    tempLog[n].tofile(logFile)
+                    n += 1
 
-                time.sleep(1)
+                    nextAcquisition = self.waitUntil(nextAcquisition + interval)
             except KeyboardInterrupt:
-                break
+                pass
+
+        return tempLog[:n]
 
 
             
@@ -186,71 +403,113 @@ routines to use the Ethernet Interface rather than the serial interface."""
         #store the device addresses in a dictionary
         self.port = 7020
         self.IP = IP
+        #every thread keeps its own persistent connection to the device,
+        #connections holds the socket and selector of each of them
+        self.local = threading.local()
+        self.connections = []
+        self.pool = None
         self.defineDevices()
-        
-    def writeValue(self, value):
-        """This is for writing only"""        
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        except socket.error:
-            print 'Failed to create socket'
-            sys.exit()
 
-        sock.connect((self.IP, self.port))
+    def connect(self):
+        """Return the connection of the calling thread, opening it if necessary."""
+        sock = getattr(self.local, "sock", None)
+        if sock is None:
+            sock = socket.create_connection((self.IP, self.port), timeout = 1)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            self.local.sock = sock
+            self.local.rxbuf = bytearray()
+            self.local.selector = selectors.DefaultSelector()
+            self.local.selector.register(sock, selectors.EVENT_READ)
+            self.connections.append((sock, self.local.selector))
+        return sock
+
+    def transaction(self):
+        """Every thread has a connection of its own, so there is nothing to lock."""
+        return contextlib.nullcontext()
+
+    def discardInput(self):
+        """Discard pending replies by dropping the connection of the calling thread."""
+        self.disconnect()
+
+    def disconnect(self):
+        """Close the connection of the calling thread."""
+        sock = getattr(self.local, "sock", None)
+        if sock is not None:
+            self.connections.remove((sock, self.local.selector))
+            self.local.selector.close()
+            sock.close()
+            self.local.sock = None
+            self.local.rxbuf = bytearray()
+
+    def readLine(self, timeout = 1.0):
+        """Read one newline terminated line from the connection of the calling thread.
+
+        Data received after the newline is kept for the next call."""
+        sock = self.connect()
+        buf = self.local.rxbuf
+        deadline = time.monotonic() + timeout
+        while b"\n" not in buf:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.local.selector.select(remaining):
+                raise socket.timeout("No reply from device within {:.2f} s".format(timeout))
+            chunk = sock.recv(4096)
+            if not chunk:
+                raise socket.error("Connection closed by device")
+            buf.extend(chunk)
+        line = buf[:buf.index(b"\n")]
+        del buf[:len(line) + 1]
+        return decodeReply(bytes(line).rstrip())
 
-        try :
-            #Set the whole string
-            sock.sendall(value + "\r\n")
-        except socket.error:
-            #Send failed
-            print 'Send failed'
-            sys.exit()
-
-        sock.close()
-
-    def readValue(self, value, readPrefix = "READ:"):
-        """This is for reading values."""
-        time.sleep(0.1)
+    def writeValue(self, value):
+        """This is for writing only.
+        The device acknowledges every command, the acknowledgement is read and discarded,
+        so that it is not taken as the reply to the next query on the connection."""
+        self.query(self.encodeCommand(value))
 
+    def query(self, command):
+        """Send an encoded command to the device and return the reply."""
         data = None
+        #wait between failed attempts, doubled after every failure
+        backoff = 0.005
         
         for retry in range(5):
             try:
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                except socket.error:
-                    print 'Failed to create socket'
-                    #sys.exit()
-
-                sock.connect((self.IP, self.port))
-
-                try :
-                    #Set the whole string
-                    sock.sendall(readPrefix + value + "\r\n")
-                except socket.error:
-                    #Send failed
-                    print 'Send failed'
-                    #sys.exit()
-
-                data = sock.recv(4096).rstrip()
-                sock.close()
+                self.connect().sendall(command)
+                data = self.readLine()
                 break
-            except:
-                print "Communication failed on attempt ", retry
-                time.sleep(1)
+            except socket.error:
+                print("Communication failed on attempt ", retry)
+                #reconnect, so that a late reply is not taken for the next answer
+                self.disconnect()
+                time.sleep(backoff)
+                backoff = min(2*backoff, 0.2)
 
-        if data is not None:                
-            return data
-        else:
-            print "Communication failed 5 times, aborting"
-            sys.exit()
+        if data is None:
+            raise IOError("Communication failed 5 times, aborting")
+        return data
 
     def getDevices(self):
         devices = self.readValue("SYS:CAT")
-        print devices
-
-    def setValue(self, value):
-        self.writeValue("SET:" + value)
+        print(devices)
 
     def close(self):
-        pass
+        self.closePool()
+        for sock, selector in list(self.connections):
+            selector.close()
+            sock.close()
+        self.connections = []
+        self.local = threading.local()
+
+
+def exportTempLog(binFile, txtFile = None):
+    """Convert a binary temperature log written by autoPollTemperatures to a text file.
+
+    - binFile: name of the .bin log file
+    - txtFile: name of the text file, defaults to binFile with the extension .txt
+    """
+    if txtFile is None:
+        txtFile = binFile.rsplit(".", 1)[0] + ".txt"
+    data = np.fromfile(binFile, dtype = np.float64).reshape(-1, 4)
+    np.savetxt(txtFile, data, header = "Time\tT1\tT2\tT3", comments="#", fmt="%.6e")
+    return data